@@ -23,10 +23,13 @@ bl_info = {
     "tracker_url": "",
 }
 
+import logging
 from typing import Any
 
 import bpy
 
+log = logging.getLogger(__name__)
+
 
 class ACTION_OT_to_scene_range(bpy.types.Operator):
     bl_idname = "action.to_scene_range"
@@ -36,10 +39,11 @@ class ACTION_OT_to_scene_range(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context) -> bool:
-        if not _is_dopesheet_editor(context):
+        space_data = context.space_data
+        if not _is_dopesheet_editor(space_data):
             return False
 
-        action = cls._get_action(context)
+        action = cls._get_action(context, space_data)
         scene = context.scene
 
         if not action:
@@ -55,7 +59,7 @@ class ACTION_OT_to_scene_range(bpy.types.Operator):
         return True
 
     def execute(self, context: bpy.types.Context) -> set[str]:
-        action = self._get_action(context)
+        action = self._get_action(context, context.space_data)
         scene = context.scene
 
         start, end = _action_to_scene_range(action, scene)
@@ -64,8 +68,8 @@ class ACTION_OT_to_scene_range(bpy.types.Operator):
         return {'FINISHED'}
 
     @staticmethod
-    def _get_action(context: bpy.types.Context) -> bpy.types.Action | None:
-        action = getattr(context.space_data, 'action', None)
+    def _get_action(context: bpy.types.Context, space_data: bpy.types.Space | None) -> bpy.types.Action | None:
+        action = getattr(space_data, 'action', None)
         if action:
             return action
         return getattr(context, 'active_action', None)
@@ -76,10 +80,8 @@ _register, _unregister = bpy.utils.register_classes_factory(classes)
 
 
 def _get_range_action(action: bpy.types.Action) -> tuple[int, int]:
-    action_range = tuple(action.frame_range)
-    frame_start = int(action_range[0])
-    frame_end = int(action_range[1])
-    return frame_start, frame_end
+    frame_range = action.frame_range
+    return int(frame_range[0]), int(frame_range[1])
 
 
 def _get_range_scene(scene: bpy.types.Scene) -> tuple[int, int]:
@@ -88,21 +90,43 @@ def _get_range_scene(scene: bpy.types.Scene) -> tuple[int, int]:
     return scene.frame_start, scene.frame_end
 
 
-def _action_to_scene_range(action: bpy.types.Action, scene: bpy.types.Scene) -> tuple[float, float]:
+def _action_to_scene_range(action: bpy.types.Action, scene: bpy.types.Scene) -> tuple[int, int]:
+    """Set the scene (preview) range to the Action's range.
+
+    :return: the new range.
+    """
     frame_start, frame_end = _get_range_action(action)
+    scene_start, scene_end = _get_range_scene(scene)
 
+    # Only write what actually changes, as every write triggers notifiers & redraws.
     if scene.use_preview_range:
-        scene.frame_preview_start = frame_start
-        scene.frame_preview_end = frame_end
+        if scene_start != frame_start:
+            scene.frame_preview_start = frame_start
+        if scene_end != frame_end:
+            scene.frame_preview_end = frame_end
     else:
-        scene.frame_start = frame_start
-        scene.frame_end = frame_end
+        if scene_start != frame_start:
+            scene.frame_start = frame_start
+        if scene_end != frame_end:
+            scene.frame_end = frame_end
 
     return (frame_start, frame_end)
 
 
+# Bursts of Action changes are coalesced, and only handled once no new change
+# has come in for this long.
+_action_change_delay = 0.05  # seconds
+
+
 def _on_action_change() -> None:
-    ob = bpy.context.object
+    # Re-arm the timer, so that it fires after the last change of a burst.
+    _cancel_pending_action_change()
+    bpy.app.timers.register(_handle_action_change, first_interval=_action_change_delay)
+
+
+def _handle_action_change() -> None:
+    # Timers run without a window or screen, so context.object is not available.
+    ob = bpy.context.view_layer.objects.active
     if not ob or not ob.animation_data:
         return
     action = ob.animation_data.action
@@ -113,8 +137,17 @@ def _on_action_change() -> None:
         # Only do automatic syncing on Actions that have 'Manual Frame Range' checked.
         return
 
-    frame_start, frame_end = _action_to_scene_range(action, bpy.context.scene)
-    print(f"{ob.name} changed to action {action.name} with range {frame_start}-{frame_end}")
+    scene = bpy.context.scene
+    if _get_range_action(action) == _get_range_scene(scene):
+        return
+
+    frame_start, frame_end = _action_to_scene_range(action, scene)
+    log.debug("%s changed to action %s with range %d-%d", ob.name, action.name, frame_start, frame_end)
+
+
+def _cancel_pending_action_change() -> None:
+    if bpy.app.timers.is_registered(_handle_action_change):
+        bpy.app.timers.unregister(_handle_action_change)
 
 
 ### Messagebus subscription to monitor changes & refresh panels.
@@ -122,6 +155,14 @@ _msgbus_owner = object()
 
 
 def _register_message_bus() -> None:
+    # Clear any existing subscription first, to avoid duplicate notifications
+    # when this is called multiple times without unregistering in between.
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+
+    # A change that is pending from before loading a file should not be
+    # applied to the newly loaded file.
+    _cancel_pending_action_change()
+
     bpy.msgbus.subscribe_rna(
         key=(bpy.types.SpaceDopeSheetEditor, "action"),
         owner=_msgbus_owner,
@@ -133,6 +174,7 @@ def _register_message_bus() -> None:
 
 def _unregister_message_bus() -> None:
     bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _cancel_pending_action_change()
 
 
 @bpy.app.handlers.persistent  # type: ignore
@@ -142,7 +184,7 @@ def _on_blendfile_load_post(none: Any, other_none: Any) -> None:
 
 
 def _draw_header_button(self, context: bpy.types.Context) -> None:
-    if not _is_action_editor(context):
+    if not _is_action_editor(context.space_data):
         return
     self.layout.operator("action.to_scene_range", text="", icon='PREVIEW_RANGE')
 
@@ -155,12 +197,12 @@ def _draw_panel_button(self, context: bpy.types.Context) -> None:
     self.layout.operator("action.to_scene_range", text=f"Action → {range_name} Range", icon='PREVIEW_RANGE')
 
 
-def _is_dopesheet_editor(context: bpy.types.Context) -> bool:
-    return context.space_data and context.space_data.type == 'DOPESHEET_EDITOR'
+def _is_dopesheet_editor(space_data: bpy.types.Space | None) -> bool:
+    return space_data is not None and space_data.type == 'DOPESHEET_EDITOR'
 
 
-def _is_action_editor(context: bpy.types.Context) -> bool:
-    return _is_dopesheet_editor(context) and context.space_data.mode == 'ACTION'
+def _is_action_editor(space_data: bpy.types.Space | None) -> bool:
+    return space_data is not None and _is_dopesheet_editor(space_data) and space_data.mode == 'ACTION'
 
 
 def register():
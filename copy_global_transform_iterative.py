@@ -12,7 +12,7 @@
 # - [x] Support for bones
 # - [x] Support for quaternion rotation
 # - [ ] Support for axis angle
-# - [ ] Support for euler wrapping
+# - [x] Support for euler wrapping
 # - [ ] Support for axis angle/quaternion flipping
 
 
@@ -24,12 +24,15 @@ Simple add-on for copying world-space transforms.
 It's called "global" to avoid confusion with the Blender World data-block.
 """
 
-import ast
+import functools
+import logging
+import math
 import time
 from dataclasses import dataclass
-from typing import Optional, Protocol, TypeAlias, Optional
+from typing import Callable, Optional, Protocol, Sequence, TypeAlias
 
 import bpy
+import numpy as np
 from bpy.types import Context, Operator, Object, PoseBone, Event
 from mathutils import Vector, Matrix, Quaternion, Euler
 
@@ -47,13 +50,18 @@ bl_info = {
 }
 
 
-DoFs: TypeAlias = Vector
+log = logging.getLogger(__name__)
+
+
+DoFs: TypeAlias = np.ndarray
 """Degrees of Freedom."""
 
 
 class Transformable(Protocol):
     """Interface for a bone or an object."""
 
+    rotation_mode: str
+
     def calc_dofs(self) -> DoFs:
         """Return the current DoFs.
 
@@ -68,15 +76,37 @@ class Transformable(Protocol):
     def matrix_world(self) -> Matrix:
         pass
 
+    def matrix_basis(self) -> Matrix:
+        """Return the local transform, before parenting & constraints."""
+        pass
+
+    def apply_matrix_world(self, matrix: Matrix) -> None:
+        """Directly set location & rotation so that the world matrix matches.
+
+        This is exact as long as the subject is not affected by constraints.
+        """
+        pass
+
 
 class TransformableObject:
+    __slots__ = (
+        'object',
+        'view_layer',
+        'rotation_mode',
+        'rotation_prop_name',
+        '_set_rotation',
+        '_update_view_layer',
+    )
+
     object: Object
     view_layer: bpy.types.ViewLayer
+    rotation_mode: str
     rotation_prop_name: str
 
     def __init__(self, context: Context, object: Object) -> None:
         self.view_layer = context.view_layer
         self.object = object
+        self.rotation_mode = object.rotation_mode
 
         match object.rotation_mode:
             case "AXIS_ANGLE":
@@ -86,30 +116,53 @@ class TransformableObject:
             case _:
                 self.rotation_prop_name = "rotation_euler"
 
+        # Bind these once, as they're called on every solver step.
+        self._set_rotation = functools.partial(setattr, object, self.rotation_prop_name)
+        self._update_view_layer = self.view_layer.update
+
     def calc_dofs(self) -> DoFs:
-        loc_dofs = list(self.object.location)
-        rot_dofs = list(getattr(self.object, self.rotation_prop_name))
-        return Vector(loc_dofs + rot_dofs)
+        return _concat_vectors(self.object.location, getattr(self.object, self.rotation_prop_name))
 
     def apply_dofs(self, dofs: DoFs) -> None:
-        self.object.location = dofs[0:3]
-        setattr(self.object, self.rotation_prop_name, dofs[3:])
-        self.view_layer.update()
+        self.object.location = dofs[0:3].tolist()
+        self._set_rotation(dofs[3:].tolist())
+        self._update_view_layer()
 
     def matrix_world(self) -> Matrix:
         return self.object.matrix_world
 
+    def matrix_basis(self) -> Matrix:
+        return self.object.matrix_basis
+
+    def apply_matrix_world(self, matrix: Matrix) -> None:
+        loc, rot = _decompose_in_parent_space(self.matrix_world(), self.object.matrix_basis, matrix)
+        self.object.location = loc
+        _apply_rotation(self.object, rot)
+        self.view_layer.update()
+
 
 class TransformableBone:
+    __slots__ = (
+        'arm_object',
+        'pose_bone',
+        'view_layer',
+        'rotation_mode',
+        'rotation_prop_name',
+        '_set_rotation',
+        '_update_view_layer',
+    )
+
     arm_object: Object
     pose_bone: PoseBone
     view_layer: bpy.types.ViewLayer
+    rotation_mode: str
     rotation_prop_name: str
 
     def __init__(self, context: Context, arm_object: Object, pose_bone: PoseBone) -> None:
         self.view_layer = context.view_layer
         self.arm_object = arm_object
         self.pose_bone = pose_bone
+        self.rotation_mode = pose_bone.rotation_mode
 
         match pose_bone.rotation_mode:
             case "AXIS_ANGLE":
@@ -119,38 +172,150 @@ class TransformableBone:
             case _:
                 self.rotation_prop_name = "rotation_euler"
 
+        # Bind these once, as they're called on every solver step.
+        self._set_rotation = functools.partial(setattr, pose_bone, self.rotation_prop_name)
+        self._update_view_layer = self.view_layer.update
+
     def calc_dofs(self) -> DoFs:
-        loc_dofs = list(self.pose_bone.location)
-        rot_dofs = list(getattr(self.pose_bone, self.rotation_prop_name))
-        return Vector(loc_dofs + rot_dofs)
+        return _concat_vectors(self.pose_bone.location, getattr(self.pose_bone, self.rotation_prop_name))
 
     def apply_dofs(self, dofs: DoFs) -> None:
-        self.pose_bone.location = dofs[0:3]
-        setattr(self.pose_bone, self.rotation_prop_name, dofs[3:])
-        self.view_layer.update()
+        self.pose_bone.location = dofs[0:3].tolist()
+        self._set_rotation(dofs[3:].tolist())
+        self._update_view_layer()
 
     def matrix_world(self) -> Matrix:
         mat = self.arm_object.matrix_world @ self.pose_bone.matrix
         return mat
 
+    def matrix_basis(self) -> Matrix:
+        return self.pose_bone.matrix_basis
+
+    def apply_matrix_world(self, matrix: Matrix) -> None:
+        loc, rot = _decompose_in_parent_space(self.matrix_world(), self.pose_bone.matrix_basis, matrix)
+        self.pose_bone.location = loc
+        _apply_rotation(self.pose_bone, rot)
+        self.view_layer.update()
+
+
+def _concat_vectors(first: Sequence[float], second: Sequence[float]) -> np.ndarray:
+    """Return a new array with the values of both sequences, without intermediate lists."""
+    size = len(first)
+    result = np.empty(size + len(second))
+    result[:size] = first
+    result[size:] = second
+    return result
+
 
-@dataclass
+def _decompose_in_parent_space(matrix_world: Matrix, matrix_basis: Matrix, target: Matrix) -> tuple[Vector, Quaternion]:
+    """Decompose the target world matrix into local location & rotation.
+
+    The parent space is derived from the current world and basis matrices, so
+    that it includes parenting (both to objects and bones) without having to
+    distinguish between those cases.
+
+    Raises ValueError when the parent space cannot be inverted, for example
+    due to zero scale.
+    """
+    parent_space = matrix_world @ matrix_basis.inverted()
+    local = parent_space.inverted() @ target
+    loc, rot, _ = local.decompose()
+    return loc, rot
+
+
+def _apply_rotation(target: Object | PoseBone, rot: Quaternion) -> None:
+    if target.rotation_mode == 'QUATERNION':
+        rot.make_compatible(target.rotation_quaternion)
+        target.rotation_quaternion = rot
+    else:
+        target.rotation_euler = rot.to_euler(target.rotation_mode, target.rotation_euler)
+
+
+def _euler_angular_velocities(euler: Euler) -> list[Vector]:
+    """Return the angular velocity caused by changing each of the X, Y, Z angles.
+
+    The velocities are expressed in the parent space of the rotation.
+    """
+    velocities = [Vector()] * 3
+    rot_after = Matrix.Identity(3)
+    # The first axis of the rotation order is applied first, so walk backwards
+    # to accumulate the rotations that are applied after each axis.
+    for axis in reversed(euler.order):
+        axis_index = 'XYZ'.index(axis)
+        velocities[axis_index] = Vector(rot_after.col[axis_index])
+        rot_after = rot_after @ Matrix.Rotation(euler[axis_index], 3, axis)
+    return velocities
+
+
+# Unit quaternions along the W, X, Y, Z components.
+_quaternion_basis = (
+    Quaternion((1.0, 0.0, 0.0, 0.0)),
+    Quaternion((0.0, 1.0, 0.0, 0.0)),
+    Quaternion((0.0, 0.0, 1.0, 0.0)),
+    Quaternion((0.0, 0.0, 0.0, 1.0)),
+)
+
+
+def _quaternion_angular_velocities(quat: Quaternion) -> list[Vector]:
+    """Return the angular velocity caused by changing each of the W, X, Y, Z components.
+
+    The velocities are expressed in the parent space of the rotation.
+
+    For a normalised quaternion q, the angular velocity is ω = 2 q' q*. Blender
+    normalises the quaternion before use, which divides the derivative by |q|
+    and removes its component along q; the latter doesn't contribute to ω.
+    """
+    factor = 2.0 / quat.magnitude
+    quat_conj = quat.normalized().conjugated()
+    velocities = []
+    for unit in _quaternion_basis:
+        product = unit @ quat_conj
+        velocities.append(factor * Vector((product.x, product.y, product.z)))
+    return velocities
+
+
+@dataclass(slots=True)
 class ExecutionState:
     dofs: DoFs
-    last_error: DoFs
-    delta: float = 0.1
+    last_error_sq: float
+    """Squared length of the error vector."""
+    last_error_vec: np.ndarray
+    last_matrix_world: Matrix
+    """World matrix of the subject, as it was used to compute the last error."""
+    delta: float = 1.0
+    """Fraction of the Gauss-Newton step that is actually taken."""
     step_num: int = 0
 
 
 class TransformSolver:
-    subjecet: Transformable
+    __slots__ = (
+        'subject',
+        'dofs_target',
+        'loc_target',
+        'rot_target',
+        'rot_target_inv',
+        'max_step_count',
+        '_rotation_from_dofs',
+        '_angular_velocities',
+    )
+
+    subject: Transformable
     dofs_target: DoFs
-    rot_target_expmap: Vector
+    loc_target: np.ndarray
+    rot_target: Quaternion
+    rot_target_inv: Quaternion
     max_step_count: int
 
+    max_error_sq = 0.0001**2
+    """Squared error below which the solver is considered done."""
+
+    max_model_step_count = 20
+    """Maximum number of Gauss-Newton steps on the model, per actual step."""
+
     def __init__(self, subject: Transformable, dofs_target: DoFs, max_step_count: int = 10000) -> None:
         self.subject = subject
         self.dofs_target = dofs_target
+        self.loc_target = dofs_target[:3].copy()
         self.max_step_count = max_step_count
 
         # TODO: do this better.
@@ -161,65 +326,109 @@ class TransformSolver:
                 quat = Quaternion(dofs_target[3:])
             case _:  # Wait, whut?
                 raise ValueError(f'no idea what to with {dofs_target}')
-        self.rot_target_expmap = quat.to_exponential_map()
+        self.rot_target = quat
+        self.rot_target_inv = quat.inverted()
+
+        # Resolve the rotation mode once, instead of on every model evaluation.
+        self._rotation_from_dofs: Callable[[DoFs], Quaternion | Euler]
+        self._angular_velocities: Callable[[DoFs], list[Vector]]
+        match subject.rotation_mode:
+            case 'QUATERNION':
+                self._rotation_from_dofs = lambda dofs: Quaternion(dofs[3:]).normalized()
+                self._angular_velocities = lambda dofs: _quaternion_angular_velocities(Quaternion(dofs[3:]))
+            case rotation_mode:
+                self._rotation_from_dofs = lambda dofs: Euler(dofs[3:], rotation_mode)
+                self._angular_velocities = lambda dofs: _euler_angular_velocities(Euler(dofs[3:], rotation_mode))
 
     def setup(self) -> ExecutionState:
-        err_vec = self._calc_error_vec()
-        delta = self._delta_for_error(1.0, err_vec)
+        mat = self.subject.matrix_world().copy()
+        err_vec = self._calc_error_vec(mat)
 
         state = ExecutionState(
             dofs=self.subject.calc_dofs(),
-            last_error=self._calc_error(err_vec),
-            delta=delta,
+            last_error_sq=self._calc_error_sq(err_vec),
+            last_error_vec=err_vec,
+            last_matrix_world=mat,
         )
 
-        print(f"startup state: {state}")
+        log.debug("startup state: %s", state)
 
         return state
 
     def step(self, state: ExecutionState) -> Optional[ExecutionState]:
         state.step_num += 1
-        new_dofs = state.dofs.copy()
-
-        print(f"Step {state.step_num}: iterating over {len(state.dofs)} DoFs")
-        for dof_index in range(len(state.dofs)):
-            dof_step = self._optimisation_step(state.dofs, dof_index, state.delta, state.last_error)
-            if dof_step == 0:
-                print(f"Step {state.step_num}: skipping update of dof {dof_index}, change in error too small.")
-                print(f"  error={state.last_error}")
-                print(f"  delta={state.delta}")
-                continue
-            new_dofs[dof_index] += dof_step
-
-        state.dofs = new_dofs
-        self.subject.apply_dofs(state.dofs)
-
-        err_vec = self._calc_error_vec()
-        error = self._calc_error(err_vec)
-
-        if error < 0.0001:
-            print('Done, error is small enough.')
+        subject = self.subject
+
+        # Solve against a model of the world matrix, which is cheap as it
+        # doesn't involve the depsgraph. Only the result is applied to the
+        # subject, to measure the actual world matrix once per step.
+        matrix_basis = subject.matrix_basis()
+        parent_space = state.last_matrix_world @ matrix_basis.inverted()
+        scale = matrix_basis.to_scale()
+
+        # Working copy, updated in-place by the model steps.
+        dofs = state.dofs.copy()
+        err_vec = state.last_error_vec
+        model_error_sq = state.last_error_sq
+        for _ in range(self.max_model_step_count):
+            # Take a (partial) Gauss-Newton step.
+            jacobian = self._calc_jacobian(dofs, parent_space)
+            dofs_step, *_ = np.linalg.lstsq(jacobian, -err_vec, rcond=None)
+            dofs_step *= state.delta
+            dofs += dofs_step
+
+            err_vec = self._calc_error_vec(self._predict_matrix_world(dofs, parent_space, scale))
+            prev_model_error_sq = model_error_sq
+            model_error_sq = self._calc_error_sq(err_vec)
+            if model_error_sq < self.max_error_sq:
+                break
+            if self._is_stalled(prev_model_error_sq, model_error_sq, state.delta):
+                # The remaining error cannot be solved with these DoFs (for
+                # example due to non-uniform scale), so stop iterating.
+                break
+
+        state.dofs = dofs
+        subject.apply_dofs(state.dofs)
+
+        mat = subject.matrix_world().copy()
+        err_vec = self._calc_error_vec(mat)
+        error_sq = self._calc_error_sq(err_vec)
+
+        if error_sq < self.max_error_sq:
+            log.debug('Done, error is small enough.')
             return None
 
-        if error > state.last_error:
-            diff = error - state.last_error
-            print(
-                f'Step {state.step_num}: error is getting bigger, '
-                f'from {state.last_error:.7f} to {error:.7f} '
-                f'(difference of {diff:5.03g})'
-            )
-
-            if state.delta > 1e-6:
-                print(f'\033[91mDecreasing delta\033[0m from {state.delta} ', end='')
-                state.delta = max(1e-5, state.delta * 0.90)
-                print(f'to {state.delta}')
+        if self._is_stalled(state.last_error_sq, error_sq, state.delta):
+            # Another step won't make a difference, so don't spend another
+            # depsgraph evaluation on it.
+            log.debug('Done, error no longer changes.')
+            return None
+
+        if error_sq > state.last_error_sq:
+            if log.isEnabledFor(logging.DEBUG):
+                last_error = math.sqrt(state.last_error_sq)
+                error = math.sqrt(error_sq)
+                log.debug(
+                    'Step %d: error is getting bigger, from %.7f to %.7f (difference of %5.03g)',
+                    state.step_num,
+                    last_error,
+                    error,
+                    error - last_error,
+                )
+
+            if state.delta > 1e-3:
+                new_delta = max(1e-3, state.delta * 0.5)
+                log.debug('Decreasing delta from %s to %s', state.delta, new_delta)
+                state.delta = new_delta
         else:
-            state.delta = self._delta_for_error(state.delta, err_vec)
+            state.delta = min(1.0, state.delta * 2.0)
 
-        state.last_error = error
+        state.last_error_sq = error_sq
+        state.last_error_vec = err_vec
+        state.last_matrix_world = mat
 
         if state.step_num >= self.max_step_count:
-            print(f'Ran out of steps, stopping at {state.step_num}')
+            log.debug('Ran out of steps, stopping at %d', state.step_num)
             return None
 
         return state
@@ -227,11 +436,12 @@ class TransformSolver:
     def execute(self) -> None:
         state = self.setup()
 
+        step = self.step
         time_start = time.monotonic()
         while True:
             # Don't assign directly to 'state' so that the last not-None state
             # is available when execution ends.
-            next_state = self.step(state)
+            next_state = step(state)
             if next_state is None:
                 break
             state = next_state
@@ -240,84 +450,110 @@ class TransformSolver:
         duration = time_end - time_start
         per_step = duration / (state.step_num + 1)
 
-        print(f'Steps   : {state.step_num+1}')
-        print(f'Duration: {duration:.1f} sec')
-        print(f'per step: {1000*per_step:.1f} msec')
-        print(f'last delta: {state.delta}')
-
-        error_vec = self._calc_error_vec()
-        print(f'error dofs : {self.fmt_dofs(error_vec)}')
-
-        error = self._calc_error(error_vec)
-        print(f'final error: {error}')
+        error_vec = self._calc_error_vec(self.subject.matrix_world())
+        error = math.sqrt(self._calc_error_sq(error_vec))
+
+        log.info(
+            'Solved in %d steps, %.1f sec (%.1f msec per step), last delta %s, final error %s, error DoFs %s',
+            state.step_num + 1,
+            duration,
+            1000 * per_step,
+            state.delta,
+            error,
+            self.fmt_dofs(error_vec),
+        )
 
-    def _optimisation_step(self, last_dofs: DoFs, dof_index: int, delta: float, last_error: float) -> float:
-        """Return the delta to be applied to the given DoF."""
+    def _is_stalled(self, last_error_sq: float, error_sq: float, delta: float) -> bool:
+        """Return whether the change in error is too small to bother continuing.
 
-        dofs = last_dofs.copy()
-        dofs[dof_index] += delta
+        The tolerance scales with delta, as smaller steps produce smaller changes.
+        """
+        return abs(last_error_sq - error_sq) < delta * self.max_error_sq
 
-        self.subject.apply_dofs(dofs)
+    def _predict_matrix_world(self, dofs: DoFs, parent_space: Matrix, scale: Vector) -> Matrix:
+        """Return the world matrix the subject would get with these DoFs.
 
-        error_vec = self._calc_error_vec()
-        error = self._calc_error(error_vec)
+        This models the world matrix as `parent_space @ matrix_basis`, where the
+        parent space is considered constant. Constraints are not part of this
+        model, but as the error is always measured on the actual world matrix
+        as well, they only slow down convergence.
+        """
+        rot = self._rotation_from_dofs(dofs)
+        return parent_space @ Matrix.LocRotScale(dofs[:3], rot, scale)
 
-        # Clean up after ourselves.
-        self.subject.apply_dofs(last_dofs)
+    def _calc_jacobian(self, dofs: DoFs, parent_space: Matrix) -> np.ndarray:
+        """Return the Jacobian of the error vector w.r.t. the DoFs.
 
-        # if abs(last_error - error) < 1e-5:
-        #     # Altering this DoF doesn't change the error, don't bother stepping.
-        #     # This is to avoid adjusting all DoFs when only one still has an error.
-        #     return 0.0
+        This uses the same model as _predict_matrix_world().
+        """
+        parent_rot = parent_space.to_3x3().normalized()
 
-        if error < last_error:
-            # This was going in the right direction.
-            step = delta
-        else:
-            # It made things worse, so go the opposite direction.
-            step = -delta
+        velocities = self._angular_velocities(dofs)
 
-        return step
+        jacobian = np.zeros((6, len(dofs)))
+        jacobian[:3, :3] = parent_space.to_3x3()
+        # Rotate all velocities into world space in one go.
+        jacobian[3:, 3:] = np.asarray(parent_rot) @ np.asarray(velocities).T
+        return jacobian
 
     @staticmethod
-    def fmt_dofs(dofs: Vector) -> str:
+    def fmt_dofs(dofs: np.ndarray) -> str:
         comma_sep = ', '.join('%-.5f' % s for s in dofs)
         return f'[{comma_sep}]'
 
     @staticmethod
-    def dofs_from_matrix(mat: Matrix) -> Vector:
-        # Returns Vector of DoFs in world space.
-        return Vector(list(mat.to_translation()) + list(mat.to_euler()))
+    def dofs_from_matrix(mat: Matrix) -> DoFs:
+        # Returns DoFs in world space.
+        return _concat_vectors(mat.to_translation(), mat.to_euler())
 
-    def _calc_error_vec(self) -> Vector:
-        mat = self.subject.matrix_world()
-        dofs_subject = self.dofs_from_matrix(mat)
+    def _calc_error_vec(self, mat: Matrix) -> np.ndarray:
+        err_vec = np.empty(6)
+        err_vec[:3] = mat.to_translation()
+        err_vec[:3] -= self.loc_target
 
-        # return dofs_subject - self.dofs_target
+        # Express the rotational error as the world-space rotation from the
+        # target to the subject. Contrary to subtracting exponential maps, this
+        # changes linearly with the angular velocity, which is what the
+        # Jacobian describes.
+        rot_diff = mat.to_quaternion() @ self.rot_target_inv
+        if rot_diff.w < 0:
+            # Take the shortest way around, so that the angle stays within [-pi, pi].
+            rot_diff.negate()
+        err_vec[3:] = rot_diff.to_exponential_map()
 
-        err_loc = dofs_subject.xyz - self.dofs_target.xyz
+        return err_vec
 
-        # TODO: do this better.
-        match len(dofs_subject):
-            case 6:  # Euler angles.
-                quat = Euler(dofs_subject[3:]).to_quaternion()
-            case 7:  # Quaternions.
-                quat = Quaternion(dofs_subject[3:])
-            case _:  # Wait, whut?
-                raise ValueError(f'no idea what to with {dofs_subject}')
+    def _calc_error_sq(self, error_vec: np.ndarray) -> float:
+        """Return the squared error, which avoids a sqrt() for comparisons."""
+        return float(error_vec @ error_vec)
+
+
+# Maps the brackets & commas of a matrix repr to whitespace.
+_m4_punctuation = str.maketrans('(),', '   ')
+
+
+def _parse_m4_floats(value: str) -> Optional[Matrix]:
+    """Parse 16 floats, separated by whitespace and/or commas, into a 4x4 matrix.
+
+    Returns None if the value is not exactly 16 numbers.
+    """
+    try:
+        floats = np.fromstring(value.translate(_m4_punctuation), sep=' ')
+    except ValueError:
+        # NumPy 2 raises on unparseable text, whereas NumPy 1 returns what it could parse.
+        return None
+    if floats.shape != (16,):
+        return None
+    return Matrix(floats.reshape(4, 4).tolist())
 
-        rot_subject_expmap = quat.to_exponential_map()
-        err_rot = rot_subject_expmap - self.rot_target_expmap
 
-        return Vector(list(err_loc) + list(err_rot))
+def _clipboard_has_matrix(clipboard: str) -> bool:
+    # Only look at the start of the clipboard, to avoid copying the entire
+    # string just to strip it.
+    return clipboard[:64].lstrip().startswith(("Matrix(", "<Matrix 4x4"))
 
-    def _calc_error(self, error_vec: Vector) -> float:
-        return float(error_vec.length)
 
-    def _delta_for_error(self, current_delta: float, error_vec: Vector) -> float:
-        average = sum(abs(x) for x in error_vec) / len(error_vec)
-        delta: float = max(1e-5, current_delta * 0.75, average)
-        return delta
+_singular_matrix_message = "Unable to paste, the transform of the object or bone cannot be inverted (zero scale?)"
 
 
 class OBJECT_OT_paste_transform_iterative(Operator):
@@ -328,18 +564,38 @@ class OBJECT_OT_paste_transform_iterative(Operator):
     )
     bl_options = {'REGISTER', 'UNDO'}
 
+    use_iterative: bpy.props.BoolProperty(  # type: ignore
+        name="Iterative (Debug)",
+        description="Use the iterative solver instead of computing the transform directly. Only useful for debugging",
+        default=False,
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
     state: ExecutionState
 
+    step_time_budget = 0.016
+    """Time in seconds to spend on solver steps per timer event, about one frame at 60 FPS."""
+
     def execute(self, context: Context) -> set[str]:
+        if not self.use_iterative:
+            return self._execute_direct(context)
+
         solver = self._get_solver(context)
         if not solver:
             # Error has already been reported.
             return {'CANCELLED'}
 
-        solver.execute()
+        try:
+            solver.execute()
+        except ValueError:
+            self.report({'ERROR'}, _singular_matrix_message)
+            return {'CANCELLED'}
         return {'FINISHED'}
 
     def invoke(self, context: Context, event: Event) -> set[str]:
+        if not self.use_iterative:
+            return self._execute_direct(context)
+
         solver = self._get_solver(context)
         if not solver:
             return {'CANCELLED'}
@@ -356,8 +612,8 @@ class OBJECT_OT_paste_transform_iterative(Operator):
 
     def modal(self, context: Context, event: Event) -> set[str]:
         if event.type in {'RIGHTMOUSE', 'ESC'}:
-            msg = f'Aborted after {self.state.step_num} steps, error = {self.state.last_error:.4f}'
-            print(msg)
+            msg = f'Aborted after {self.state.step_num} steps, error = {math.sqrt(self.state.last_error_sq):.4f}'
+            log.info(msg)
             self.report({'WARNING'}, msg)
             self.cancel(context)
             return {'FINISHED'}
@@ -365,12 +621,25 @@ class OBJECT_OT_paste_transform_iterative(Operator):
         if event.type != 'TIMER':
             return {'PASS_THROUGH'}
 
-        new_state = self.solver.step(self.state)
-        if new_state is None:
-            self.report({'INFO'}, f'Done after {self.state.step_num} steps')
-            self.cancel(context)
-            return {'FINISHED'}
-        self.state = new_state
+        # Run as many steps as fit in the time budget, so that the timer event
+        # overhead is spread over multiple steps.
+        step = self.solver.step
+        deadline = time.monotonic() + self.step_time_budget
+        while True:
+            try:
+                new_state = step(self.state)
+            except ValueError:
+                self.report({'ERROR'}, _singular_matrix_message)
+                self.cancel(context)
+                return {'CANCELLED'}
+            if new_state is None:
+                self.report({'INFO'}, f'Done after {self.state.step_num} steps')
+                self.cancel(context)
+                return {'FINISHED'}
+            self.state = new_state
+
+            if time.monotonic() >= deadline:
+                break
 
         return {'RUNNING_MODAL'}
 
@@ -378,43 +647,56 @@ class OBJECT_OT_paste_transform_iterative(Operator):
         wm = context.window_manager
         wm.event_timer_remove(self._timer)
 
+    def _execute_direct(self, context: Context) -> set[str]:
+        mat = self.get_matrix_from_clipboard(context)
+        if mat is None:
+            self.report({'ERROR'}, "Clipboard does not contain a valid matrix")
+            return {'CANCELLED'}
+
+        subject = self._get_subject(context)
+        try:
+            subject.apply_matrix_world(mat)
+        except ValueError:
+            self.report({'ERROR'}, _singular_matrix_message)
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
     def _get_solver(self, context: Context) -> Optional[TransformSolver]:
         mat = self.get_matrix_from_clipboard(context)
         if mat is None:
             self.report({'ERROR'}, "Clipboard does not contain a valid matrix")
             return None
 
-        subject: Transformable
-        if context.active_pose_bone:
-            subject = TransformableBone(context, context.active_object, context.active_pose_bone)
-        else:
-            subject = TransformableObject(context, context.active_object)
-
+        subject = self._get_subject(context)
         dofs_target = TransformSolver.dofs_from_matrix(mat)
         solver = TransformSolver(subject, dofs_target)
 
         return solver
 
+    @staticmethod
+    def _get_subject(context: Context) -> Transformable:
+        if context.active_pose_bone:
+            return TransformableBone(context, context.active_object, context.active_pose_bone)
+        return TransformableObject(context, context.active_object)
+
     @classmethod
     def poll(cls, context: Context) -> bool:
-        if not context.active_pose_bone and not context.active_object:
+        if not context.active_object and not context.active_pose_bone:
             cls.poll_message_set("Select an object or pose bone")
             return False
 
-        clipboard = context.window_manager.clipboard.strip()
-        if not (clipboard.startswith("Matrix(") or clipboard.startswith("<Matrix 4x4")):
+        if not _clipboard_has_matrix(context.window_manager.clipboard):
             cls.poll_message_set("Clipboard does not contain a valid matrix")
             return False
         return True
 
     @classmethod
     def get_matrix_from_clipboard(cls, context: Context) -> Optional[Matrix]:
-        clipboard = context.window_manager.clipboard.strip()
-        if clipboard.startswith("Matrix"):
-            return Matrix(ast.literal_eval(clipboard[6:]))
-        if clipboard.startswith("<Matrix 4x4"):
-            return cls.parse_repr_m4(clipboard[12:-1])
-        return cls.parse_print_m4(clipboard)
+        mat = _parse_clipboard(context.window_manager.clipboard.strip())
+        if mat is None:
+            return None
+        # The parsed matrix is cached, so don't hand out the cached instance.
+        return mat.copy()
 
     @staticmethod
     def parse_print_m4(value: str) -> Optional[Matrix]:
@@ -423,23 +705,32 @@ class OBJECT_OT_paste_transform_iterative(Operator):
         Expects four lines of space-separated floats.
         """
 
-        lines = value.strip().splitlines()
-        if len(lines) != 4:
+        value = value.strip()
+        if value.count('\n') != 3:
             return None
-
-        floats = tuple(tuple(float(item) for item in line.split()) for line in lines)
-        return Matrix(floats)
+        return _parse_m4_floats(value)
 
     @staticmethod
     def parse_repr_m4(value: str) -> Optional[Matrix]:
         """Four lines of (a, b, c, d) floats."""
 
-        lines = value.strip().splitlines()
-        if len(lines) != 4:
+        value = value.strip()
+        if value.count('\n') != 3:
             return None
+        return _parse_m4_floats(value)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_clipboard(clipboard: str) -> Optional[Matrix]:
+    """Parse the (stripped) clipboard contents into a matrix.
 
-        floats = tuple(tuple(float(item.strip()) for item in line.strip()[1:-1].split(',')) for line in lines)
-        return Matrix(floats)
+    This is cached, so that repeatedly pasting the same matrix only parses it once.
+    """
+    if clipboard.startswith("Matrix"):
+        return _parse_m4_floats(clipboard[6:])
+    if clipboard.startswith("<Matrix 4x4"):
+        return OBJECT_OT_paste_transform_iterative.parse_repr_m4(clipboard[12:-1])
+    return OBJECT_OT_paste_transform_iterative.parse_print_m4(clipboard)
 
 
 def _draw_button(panel: bpy.types.Panel, context: Context) -> None:
@@ -22,12 +22,15 @@ bl_info = {
     "tracker_url": "https://projects.blender.org/blender/blender-addons/issues",
 }
 
-import ast
 import abc
 import contextlib
-from typing import Iterable, Optional, Union, Any, TypeAlias, Iterator
+import functools
+import math
+import re
+from typing import Iterable, Optional, Union, Any, TypeAlias, Iterator, Sequence, Callable
 
 import bpy
+import numpy as np
 from bpy.types import Context, Object, Operator, Panel, PoseBone, UILayout, FCurve, Camera, FModifierStepped
 from mathutils import Matrix
 
@@ -124,13 +127,17 @@ class AutoKeying:
             options.add('INSERTKEY_REPLACE')
         return options
 
-    @staticmethod
-    def get_4d_rotlock(bone: PoseBone) -> Iterable[bool]:
+    _all_locked_4d = (True,) * 4
+    _all_unlocked_4d = (False,) * 4
+
+    @classmethod
+    def get_4d_rotlock(cls, bone: PoseBone) -> Sequence[bool]:
         "Retrieve the lock status for 4D rotation."
         if bone.lock_rotations_4d:
-            return [bone.lock_rotation_w, *bone.lock_rotation]
-        else:
-            return [all(bone.lock_rotation)] * 4
+            return (bone.lock_rotation_w, *bone.lock_rotation)
+        if all(bone.lock_rotation):
+            return cls._all_locked_4d
+        return cls._all_unlocked_4d
 
     @classmethod
     def keyframe_channels(
@@ -139,19 +146,21 @@ class AutoKeying:
         options: set[str],
         data_path: str,
         group: str,
-        locks: Iterable[bool],
+        locks: Sequence[bool],
     ) -> None:
-        if all(locks):
+        # Read RNA arrays only once, instead of once for every check below.
+        unlocked_indices = [index for index, lock in enumerate(locks) if not lock]
+        if not unlocked_indices:
             return
 
-        if not any(locks):
-            target.keyframe_insert(data_path, group=group, options=options, keytype=cls._keytype)
+        keytype = cls._keytype
+        if len(unlocked_indices) == len(locks):
+            # Key all channels with a single call.
+            target.keyframe_insert(data_path, group=group, options=options, keytype=keytype)
             return
 
-        for index, lock in enumerate(locks):
-            if lock:
-                continue
-            target.keyframe_insert(data_path, index=index, group=group, options=options, keytype=cls._keytype)
+        for index in unlocked_indices:
+            target.keyframe_insert(data_path, index=index, group=group, options=options, keytype=keytype)
 
     @classmethod
     def key_transformation(
@@ -167,7 +176,23 @@ class AutoKeying:
         else:
             group = "Object Transforms"
 
-        def keyframe(data_path: str, locks: Iterable[bool]) -> None:
+        channels: list[tuple[str, Sequence[bool]]] = []
+        if cls._use_loc and not (is_bone and target.bone.use_connect):
+            channels.append(("location", target.lock_location))
+
+        if cls._use_rot:
+            match target.rotation_mode:
+                case 'QUATERNION':
+                    channels.append(("rotation_quaternion", cls.get_4d_rotlock(target)))
+                case 'AXIS_ANGLE':
+                    channels.append(("rotation_axis_angle", cls.get_4d_rotlock(target)))
+                case _:
+                    channels.append(("rotation_euler", target.lock_rotation))
+
+        if cls._use_scale:
+            channels.append(("scale", target.lock_scale))
+
+        for data_path, locks in channels:
             try:
                 cls.keyframe_channels(target, options, data_path, group, locks)
             except RuntimeError:
@@ -175,20 +200,6 @@ class AutoKeying:
                 # these curves are not available.
                 pass
 
-        if cls._use_loc and not (is_bone and target.bone.use_connect):
-            keyframe("location", target.lock_location)
-
-        if cls._use_rot:
-            if target.rotation_mode == 'QUATERNION':
-                keyframe("rotation_quaternion", cls.get_4d_rotlock(target))
-            elif target.rotation_mode == 'AXIS_ANGLE':
-                keyframe("rotation_axis_angle", cls.get_4d_rotlock(target))
-            else:
-                keyframe("rotation_euler", target.lock_rotation)
-
-        if cls._use_scale:
-            keyframe("scale", target.lock_scale)
-
     @classmethod
     def autokey_transformation(cls, context: Context, target: Union[Object, PoseBone]) -> None:
         """Auto-key transformation properties."""
@@ -212,15 +223,33 @@ def get_matrix(context: Context) -> Matrix:
 
 
 def set_matrix(context: Context, mat: Matrix) -> None:
+    _make_set_matrix(context)(mat)
+
+
+def _make_set_matrix(context: Context) -> Callable[[Matrix], None]:
+    """Return a function that sets the world matrix of the active bone or object.
+
+    The target, depsgraph, and auto-keying options are resolved once, so the
+    returned function can be called on many frames without looking them up again.
+    """
+    object = context.active_object
     bone = context.active_pose_bone
-    if bone:
+    depsgraph = context.view_layer.depsgraph
+    autokey_options = AutoKeying.autokeying_options(context)
+
+    def set_bone_matrix(mat: Matrix) -> None:
         # Convert matrix to local space
-        arm_eval = context.active_object.evaluated_get(context.view_layer.depsgraph)
+        arm_eval = object.evaluated_get(depsgraph)
         bone.matrix = arm_eval.matrix_world.inverted() @ mat
-        AutoKeying.autokey_transformation(context, bone)
-    else:
-        context.active_object.matrix_world = mat
-        AutoKeying.autokey_transformation(context, context.active_object)
+        if autokey_options is not None:
+            AutoKeying.key_transformation(bone, autokey_options)
+
+    def set_object_matrix(mat: Matrix) -> None:
+        object.matrix_world = mat
+        if autokey_options is not None:
+            AutoKeying.key_transformation(object, autokey_options)
+
+    return set_bone_matrix if bone else set_object_matrix
 
 
 def _selected_keyframes(context: Context) -> list[float]:
@@ -239,8 +268,17 @@ def _selected_keyframes_for_bone(object: Object, bone: PoseBone) -> list[float]:
 
     Only keys on the given pose bone are considered.
     """
-    name = bpy.utils.escape_identifier(bone.name)
-    return _selected_keyframes_in_action(object, f'pose.bones["{name}"].')
+    return _selected_keyframes_in_action(object, _rna_prefix_for_bone(bone.name))
+
+
+@functools.lru_cache(maxsize=4096)
+def _rna_prefix_for_bone(bone_name: str) -> str:
+    """Return the 'pose.bones["name"].' prefix of the bone's FCurve data paths.
+
+    This only depends on the name, so the cache never needs invalidating.
+    """
+    name = bpy.utils.escape_identifier(bone_name)
+    return f'pose.bones["{name}"].'
 
 
 def _selected_keyframes_for_object(object: Object) -> list[float]:
@@ -261,22 +299,32 @@ def _selected_keyframes_in_action(object: Object, rna_path_prefix: str) -> list[
     if action is None:
         return []
 
-    keyframes = set()
-    for fcurve in action.fcurves:
-        if not fcurve.data_path.startswith(rna_path_prefix):
-            continue
+    fcurves = [fcurve for fcurve in action.fcurves if fcurve.data_path.startswith(rna_path_prefix)]
+    if not fcurves:
+        return []
 
-        for kp in fcurve.keyframe_points:
-            if not kp.select_control_point:
-                continue
-            keyframes.add(kp.co.x)
-    return sorted(keyframes)
+    keyframes: list[np.ndarray] = []
+    for fcurve in fcurves:
+        # Bulk-read the keys, instead of accessing them one RNA property at a time.
+        keyframe_points = fcurve.keyframe_points
+        num_keys = len(keyframe_points)
+        co: np.ndarray = np.empty(2 * num_keys, dtype=np.float32)
+        selected: np.ndarray = np.empty(num_keys, dtype=bool)
+        keyframe_points.foreach_get("co", co)
+        keyframe_points.foreach_get("select_control_point", selected)
+
+        keyframes.append(co[0::2][selected])
+
+    # np.unique() both sorts and deduplicates.
+    frames: list[float] = np.unique(np.concatenate(keyframes)).tolist()
+    return frames
+
+
+_matrix_clipboard_format = "Matrix((\n    {!r},\n    {!r},\n    {!r},\n    {!r},\n))"
 
 
 def _copy_matrix_to_clipboard(window_manager: bpy.types.WindowManager, matrix: Matrix) -> None:
-    rows = [f"    {tuple(row)!r}," for row in matrix]
-    as_string = "\n".join(rows)
-    window_manager.clipboard = f"Matrix((\n{as_string}\n))"
+    window_manager.clipboard = _matrix_clipboard_format.format(*(tuple(row) for row in matrix))
 
 
 class OBJECT_OT_copy_global_transform(Operator):
@@ -290,7 +338,7 @@ class OBJECT_OT_copy_global_transform(Operator):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        return bool(context.active_pose_bone) or bool(context.active_object)
+        return context.active_object is not None or context.active_pose_bone is not None
 
     def execute(self, context: Context) -> set[str]:
         mat = get_matrix(context)
@@ -310,7 +358,7 @@ class OBJECT_OT_copy_relative_transform(Operator):
         rel_ob = context.scene.addon_copy_global_transform_relative_ob
         if not rel_ob:
             return False
-        return bool(context.active_pose_bone) or bool(context.active_object)
+        return context.active_object is not None or context.active_pose_bone is not None
 
     def execute(self, context: Context) -> set[str]:
         rel_ob = context.scene.addon_copy_global_transform_relative_ob
@@ -319,6 +367,36 @@ class OBJECT_OT_copy_relative_transform(Operator):
         return {'FINISHED'}
 
 
+# Sixteen floats in full repr() precision plus punctuation stay well below this,
+# so anything longer can be rejected without scanning it.
+_max_matrix_text_length = 2048
+
+_float_re = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+
+def _parse_matrix_repr(value: str) -> Optional[Matrix]:
+    """Parse the repr() of a 4x4 Matrix, like written by _copy_matrix_to_clipboard().
+
+    Returns None if the value does not contain exactly 16 numbers.
+    """
+
+    numbers = _float_re.findall(value)
+    if len(numbers) != 16:
+        return None
+
+    floats = [float(number) for number in numbers]
+    return Matrix((floats[0:4], floats[4:8], floats[8:12], floats[12:16]))
+
+
+# Mapping from rotation mirror axis to (Euler order, axis to flip, other axis to flip).
+# The order applies the to-be-flipped axes first.
+_mirror_rot_table: dict[str, tuple[str, int, int]] = {
+    'x': ('XYZ', 0, 1),  # Flip X, and also the bone roll.
+    'y': ('YZX', 1, 2),  # Flip Y, and also Z? Not sure how to handle this one.
+    'z': ('ZYX', 2, 1),  # Flip Z, and also the bone roll.
+}
+
+
 class UnableToMirrorError(Exception):
     """Raised when mirroring is enabled but no mirror object/bone is set."""
 
@@ -388,7 +466,7 @@ class OBJECT_OT_paste_transform(Operator):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        if not context.active_pose_bone and not context.active_object:
+        if not context.active_object and not context.active_pose_bone:
             cls.poll_message_set("Select an object or pose bone")
             return False
 
@@ -405,12 +483,18 @@ class OBJECT_OT_paste_transform(Operator):
         Expects four lines of space-separated floats.
         """
 
-        lines = value.strip().splitlines()
-        if len(lines) != 4:
+        value = value.strip()
+        if value.count('\n') != 3:
             return None
 
-        floats = tuple(tuple(float(item) for item in line.split()) for line in lines)
-        return Matrix(floats)
+        try:
+            floats = np.fromstring(value, sep=' ')
+        except ValueError:
+            # NumPy 2 raises on unparseable text, whereas NumPy 1 returns what it could parse.
+            return None
+        if floats.shape != (16,):
+            return None
+        return Matrix(floats.reshape(4, 4).tolist())
 
     @staticmethod
     def parse_repr_m4(value: str) -> Optional[Matrix]:
@@ -423,15 +507,22 @@ class OBJECT_OT_paste_transform(Operator):
         floats = tuple(tuple(float(item.strip()) for item in line.strip()[1:-1].split(',')) for line in lines)
         return Matrix(floats)
 
-    def execute(self, context: Context) -> set[str]:
-        clipboard = context.window_manager.clipboard.strip()
+    def parse_clipboard(self, clipboard: str) -> Optional[Matrix]:
+        """Parse the clipboard contents in any of the supported formats."""
+
+        if len(clipboard) > _max_matrix_text_length:
+            # Too long to be a matrix, so don't bother scanning it.
+            return None
+
+        clipboard = clipboard.strip()
         if clipboard.startswith("Matrix"):
-            mat = Matrix(ast.literal_eval(clipboard[6:]))
-        elif clipboard.startswith("<Matrix 4x4"):
-            mat = self.parse_repr_m4(clipboard[12:-1])
-        else:
-            mat = self.parse_print_m4(clipboard)
+            return _parse_matrix_repr(clipboard)
+        if clipboard.startswith("<Matrix 4x4"):
+            return self.parse_repr_m4(clipboard[12:-1])
+        return self.parse_print_m4(clipboard)
 
+    def execute(self, context: Context) -> set[str]:
+        mat = self.parse_clipboard(context.window_manager.clipboard)
         if mat is None:
             self.report({'ERROR'}, "Clipboard does not contain a valid matrix")
             return {'CANCELLED'}
@@ -505,19 +596,10 @@ class OBJECT_OT_paste_transform(Operator):
         trans[axis_index] *= -1
 
         # Flip the rotation, and use a rotation order that applies the to-be-flipped axes first.
-        match self.mirror_axis_rot:
-            case 'x':
-                rot_e = rot_q.to_euler('XYZ')
-                rot_e.x *= -1  # Flip the requested rotation axis.
-                rot_e.y *= -1  # Also flip the bone roll.
-            case 'y':
-                rot_e = rot_q.to_euler('YZX')
-                rot_e.y *= -1  # Flip the requested rotation axis.
-                rot_e.z *= -1  # Also flip another axis? Not sure how to handle this one.
-            case 'z':
-                rot_e = rot_q.to_euler('ZYX')
-                rot_e.z *= -1  # Flip the requested rotation axis.
-                rot_e.y *= -1  # Also flip the bone roll.
+        euler_order, flip_axis, other_flip_axis = _mirror_rot_table[self.mirror_axis_rot]
+        rot_e = rot_q.to_euler(euler_order)
+        rot_e[flip_axis] *= -1
+        rot_e[other_flip_axis] *= -1
 
         # Recompose the local matrix:
         mat_local = Matrix.LocRotScale(trans, rot_e, scale)
@@ -572,23 +654,63 @@ class OBJECT_OT_paste_transform(Operator):
         return context.scene.frame_start, context.scene.frame_end
 
     def _paste_on_frames(self, context: Context, frame_numbers: Iterable[float], matrix: Matrix) -> None:
-        current_frame = context.scene.frame_current_final
+        # Resolve these once, instead of on every frame.
+        scene = context.scene
+        set_matrix_on_frame = _make_set_matrix(context)
+
+        current_frame = scene.frame_current_final
+        last_frame = current_frame
         try:
             for frame in frame_numbers:
-                context.scene.frame_set(int(frame), subframe=frame % 1.0)
-                set_matrix(context, matrix)
+                # Every frame_set() re-evaluates the depsgraph, so avoid that
+                # when the scene is already at the right frame.
+                if frame != last_frame:
+                    scene.frame_set(int(frame), subframe=frame % 1.0)
+                    last_frame = frame
+                set_matrix_on_frame(matrix)
         finally:
-            context.scene.frame_set(int(current_frame), subframe=current_frame % 1.0)
+            scene.frame_set(int(current_frame), subframe=current_frame % 1.0)
 
 
 # Mapping from frame number to the dominant key type.
 # GENERATED is the only recessive key type, others are dominant.
 KeyInfo: TypeAlias = dict[float, str]
 
+# Matches the 'pose.bones["name"].' prefix of an FCurve data path, taking escaped quotes into account.
+_bone_prefix_re = re.compile(r'pose\.bones\["(?:[^"\\]|\\.)*"\]\.')
+
+# Mapping from Action pointer to its FCurves, grouped by bone RNA path prefix.
+# This is built up during a single operator run, and discarded afterwards.
+FCurveIndex: TypeAlias = dict[int, dict[str, list[FCurve]]]
+
+
+def _fcurves_by_prefix(fcurve_index: FCurveIndex, action: bpy.types.Action) -> dict[str, list[FCurve]]:
+    """Return the Action's FCurves, grouped by their 'pose.bones["name"].' prefix.
+
+    FCurves that do not animate a bone are grouped under the empty string.
+    The grouping is stored in fcurve_index, so that each Action is only scanned once.
+    """
+    action_ptr = action.as_pointer()
+    try:
+        return fcurve_index[action_ptr]
+    except KeyError:
+        pass
+
+    index: dict[str, list[FCurve]] = {}
+    for fcurve in action.fcurves:
+        match = _bone_prefix_re.match(fcurve.data_path)
+        prefix = match.group() if match else ""
+        index.setdefault(prefix, []).append(fcurve)
+
+    fcurve_index[action_ptr] = index
+    return index
+
 
 class Transformable(metaclass=abc.ABCMeta):
     """Interface for a bone or an object."""
 
+    __slots__ = ("_key_info_cache",)
+
     def __init__(self) -> None:
         self._key_info_cache: Optional[KeyInfo] = None
 
@@ -597,8 +719,8 @@ class Transformable(metaclass=abc.ABCMeta):
         pass
 
     @abc.abstractmethod
-    def set_matrix_world(self, context: Context, matrix: Matrix) -> None:
-        pass
+    def set_matrix_world(self, context: Context, matrix: Matrix, autokey_options: Optional[set[str]]) -> None:
+        """Set the world matrix, and key it with the given auto-keying options unless they are None."""
 
     @abc.abstractmethod
     def _my_fcurves(self) -> Iterable[bpy.types.FCurve]:
@@ -610,12 +732,20 @@ class Transformable(metaclass=abc.ABCMeta):
 
         keyinfo: KeyInfo = {}
         for fcurve in self._my_fcurves():
-            for kp in fcurve.keyframe_points:
-                frame = kp.co.x
-                if kp.type == 'GENERATED' and frame in keyinfo:
+            keyframe_points = fcurve.keyframe_points
+
+            # Bulk-read the frame numbers. The key type is an enum, which
+            # foreach_get() cannot read, so that still needs a loop.
+            co: np.ndarray = np.empty(2 * len(keyframe_points), dtype=np.float32)
+            keyframe_points.foreach_get("co", co)
+            frames = co[0::2].tolist()
+            key_types = [kp.type for kp in keyframe_points]
+
+            for frame, key_type in zip(frames, key_types):
+                if key_type == 'GENERATED' and frame in keyinfo:
                     # Don't bother overwriting other key types.
                     continue
-                keyinfo[frame] = kp.type
+                keyinfo[frame] = key_type
 
         self._key_info_cache = keyinfo
         return keyinfo
@@ -624,15 +754,32 @@ class Transformable(metaclass=abc.ABCMeta):
         self._key_info_cache = None
 
         for fcurve in self._my_fcurves():
-            to_remove = [
-                kp for kp in fcurve.keyframe_points if kp.type == key_type and (frame_start <= kp.co.x <= frame_end)
-            ]
-            for kp in reversed(to_remove):
-                fcurve.keyframe_points.remove(kp, fast=True)
-            fcurve.keyframe_points.handles_recalc()
+            keyframe_points = fcurve.keyframe_points
+
+            # Bulk-read the key coordinates to find the keys within the frame
+            # range. The key type is an enum, which foreach_get() cannot read,
+            # so that is only checked for the keys in range.
+            co: np.ndarray = np.empty(2 * len(keyframe_points), dtype=np.float32)
+            keyframe_points.foreach_get("co", co)
+            frames = co[0::2]
+            in_range = np.flatnonzero((frame_start <= frames) & (frames <= frame_end))
+
+            # Iterate backwards, so that removal doesn't shift the indices yet to be visited.
+            any_removed = False
+            for index in reversed(in_range.tolist()):
+                kp = keyframe_points[index]
+                if kp.type != key_type:
+                    continue
+                keyframe_points.remove(kp, fast=True)
+                any_removed = True
+
+            if any_removed:
+                keyframe_points.handles_recalc()
 
 
 class TransformableObject(Transformable):
+    __slots__ = ("object",)
+
     object: Object
 
     def __init__(self, object: Object) -> None:
@@ -642,9 +789,10 @@ class TransformableObject(Transformable):
     def matrix_world(self) -> Matrix:
         return self.object.matrix_world
 
-    def set_matrix_world(self, context: Context, matrix: Matrix) -> None:
+    def set_matrix_world(self, context: Context, matrix: Matrix, autokey_options: Optional[set[str]]) -> None:
         self.object.matrix_world = matrix
-        AutoKeying.autokey_transformation(context, self.object)
+        if autokey_options is not None:
+            AutoKeying.key_transformation(self.object, autokey_options)
 
     def __hash__(self) -> int:
         return hash(self.object.as_pointer())
@@ -661,23 +809,28 @@ class TransformableObject(Transformable):
 
 
 class TransformableBone(Transformable):
+    __slots__ = ("arm_object", "pose_bone", "fcurve_index")
+
     arm_object: Object
     pose_bone: PoseBone
+    fcurve_index: FCurveIndex
 
-    def __init__(self, pose_bone: PoseBone) -> None:
+    def __init__(self, pose_bone: PoseBone, fcurve_index: FCurveIndex) -> None:
         super().__init__()
         self.arm_object = pose_bone.id_data
         self.pose_bone = pose_bone
+        self.fcurve_index = fcurve_index
 
     def matrix_world(self) -> Matrix:
         mat = self.arm_object.matrix_world @ self.pose_bone.matrix
         return mat
 
-    def set_matrix_world(self, context: Context, matrix: Matrix) -> None:
+    def set_matrix_world(self, context: Context, matrix: Matrix, autokey_options: Optional[set[str]]) -> None:
         # Convert matrix to armature-local space
         arm_eval = self.arm_object.evaluated_get(context.view_layer.depsgraph)
         self.pose_bone.matrix = arm_eval.matrix_world.inverted() @ matrix
-        AutoKeying.autokey_transformation(context, self.pose_bone)
+        if autokey_options is not None:
+            AutoKeying.key_transformation(self.pose_bone, autokey_options)
 
     def __hash__(self) -> int:
         return hash(self.pose_bone.as_pointer())
@@ -687,10 +840,8 @@ class TransformableBone(Transformable):
         if not action:
             return
 
-        rna_prefix = f"{self.pose_bone.path_from_id()}."
-        for fcurve in action.fcurves:
-            if fcurve.data_path.startswith(rna_prefix):
-                yield fcurve
+        rna_prefix = _rna_prefix_for_bone(self.pose_bone.name)
+        yield from _fcurves_by_prefix(self.fcurve_index, action).get(rna_prefix, ())
 
     def _action(self) -> Optional[bpy.types.Action]:
         adt = self.arm_object.animation_data
@@ -716,7 +867,7 @@ class FixToCameraCommon:
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        if not context.active_pose_bone and not context.active_object:
+        if not context.active_object and not context.active_pose_bone:
             cls.poll_message_set("Select an object or pose bone")
             return False
         if not context.mode in {'POSE', 'OBJECT'}:
@@ -732,7 +883,9 @@ class FixToCameraCommon:
             case 'OBJECT':
                 transformables = self._transformable_objects(context)
             case 'POSE':
-                transformables = self._transformable_pbones(context)
+                # Shared between the bones, so that each Action's FCurves are only grouped once.
+                fcurve_index: FCurveIndex = {}
+                transformables = self._transformable_pbones(context, fcurve_index)
             case mode:
                 self.report({'ERROR'}, 'Unsupported mode: %r' % mode)
                 return {'CANCELLED'}
@@ -747,8 +900,8 @@ class FixToCameraCommon:
     def _transformable_objects(self, context: Context) -> list[Transformable]:
         return [TransformableObject(object=ob) for ob in context.selected_editable_objects]
 
-    def _transformable_pbones(self, context: Context) -> list[Transformable]:
-        return [TransformableBone(pose_bone=bone) for bone in context.selected_pose_bones]
+    def _transformable_pbones(self, context: Context, fcurve_index: FCurveIndex) -> list[Transformable]:
+        return [TransformableBone(pose_bone=bone, fcurve_index=fcurve_index) for bone in context.selected_pose_bones]
 
 
 class OBJECT_OT_fix_to_camera(Operator, FixToCameraCommon):
@@ -793,6 +946,11 @@ class OBJECT_OT_fix_to_camera(Operator, FixToCameraCommon):
             frame_start = scene.frame_start
             frame_end = scene.frame_end
 
+        # The key info doesn't change while fixing to the camera, so it can be
+        # fetched once instead of for every frame.
+        key_infos = {t: t.key_info() for t in transformables}
+        overwritable_key_types = {self.keytype, ""}
+
         with AutoKeying.options(
             keytype=self.keytype,
             use_loc=self.use_loc,
@@ -800,12 +958,15 @@ class OBJECT_OT_fix_to_camera(Operator, FixToCameraCommon):
             use_scale=self.use_scale,
             force_autokey=True,
         ):
+            # These options do not change during the loop.
+            autokey_options = AutoKeying.autokeying_options(context)
+
             for frame in range(frame_start, frame_end + scene.frame_step, scene.frame_step):
                 scene.frame_set(frame)
 
                 camera_eval = scene.camera.evaluated_get(depsgraph)
                 cam_matrix_world = camera_eval.matrix_world
-                camera_mat_inv = cam_matrix_world.inverted()
+                camera_mat_inv: Optional[Matrix] = None  # Only computed when needed.
 
                 if scene.camera.name != last_camera_name:
                     # The scene camera changed, so the previous
@@ -814,15 +975,16 @@ class OBJECT_OT_fix_to_camera(Operator, FixToCameraCommon):
                     last_camera_name = scene.camera.name
 
                 for t, camera_rel_matrix in matrices.items():
-                    key_info = t.key_info()
-                    key_type = key_info.get(frame, "")
-                    if key_type not in {self.keytype, ""}:
+                    key_type = key_infos[t].get(frame, "")
+                    if key_type not in overwritable_key_types:
                         # Manually set key, remember the current camera-relative matrix.
+                        if camera_mat_inv is None:
+                            camera_mat_inv = cam_matrix_world.inverted()
                         matrices[t] = camera_mat_inv @ t.matrix_world()
                         continue
 
                     # No key, or a generated one. Overwrite it with a new transform.
-                    t.set_matrix_world(context, cam_matrix_world @ camera_rel_matrix)
+                    t.set_matrix_world(context, cam_matrix_world @ camera_rel_matrix, autokey_options)
 
 
 class OBJECT_OT_delete_fix_to_camera_keys(Operator, FixToCameraCommon):
@@ -874,23 +1036,23 @@ class ANIM_OT_fcurve_bake_stepped(Operator):
         if mod.use_frame_end:
             frame_end = min(mod.frame_end, frame_end)
 
-        # Determine which keys to insert, without doing any modification to the
-        # FCurve itself.
-        step = 0
-        frame = 0.0
-        frames_to_insert: dict[float, float] = {}
-        while frame <= frame_end:
-            frame = mod.frame_offset + step * mod.frame_step
-            step += 1
-
-            if not (frame_start <= frame <= frame_end):
-                continue
-
-            frames_to_insert[frame] = fcurve.evaluate(frame)
+        if mod.frame_step <= 0:
+            return
 
-        # Insert the actual keys.
-        for frame, value in frames_to_insert.items():
-            kp = fcurve.keyframe_points.insert(frame=frame, value=value)
+        # Determine which keys to insert, without doing any modification to the
+        # FCurve itself. The step range is widened by one on either side, and
+        # then masked, to be robust against floating point rounding.
+        step_lo = max(0, math.ceil((frame_start - mod.frame_offset) / mod.frame_step) - 1)
+        step_hi = math.floor((frame_end - mod.frame_offset) / mod.frame_step) + 1
+        frames = np.arange(step_lo, step_hi + 1, dtype=np.float64) * mod.frame_step + mod.frame_offset
+        frames = frames[(frame_start <= frames) & (frames <= frame_end)]
+        values = [fcurve.evaluate(frame) for frame in frames.tolist()]
+
+        # Insert the actual keys. The 'FAST' option skips recalculating the
+        # FCurve after each insertion; that's done once by fcurve.update() below.
+        keyframe_points = fcurve.keyframe_points
+        for frame, value in zip(frames.tolist(), values):
+            kp = keyframe_points.insert(frame=frame, value=value, options={'FAST'})
             kp.type = 'BREAKDOWN'
             kp.interpolation = 'CONSTANT'
 
@@ -899,7 +1061,7 @@ class ANIM_OT_fcurve_bake_stepped(Operator):
 
     def _find_stepped_modifier(self, fcurve: FCurve) -> Optional[FModifierStepped]:
         for mod in fcurve.modifiers:
-            if isinstance(mod, FModifierStepped):
+            if mod.type == 'STEPPED':
                 return mod
         return None
 
@@ -995,11 +1157,17 @@ class VIEW3D_PT_copy_global_transform_mirror(PanelMixin, Panel):
         """Search within the bones of the given armature."""
         assert armature_ob and armature_ob.type == 'ARMATURE'
 
+        bones_prop = "edit_bones" if armature_ob.mode == 'EDIT' else "bones"
+        if not getattr(armature_ob.data, bones_prop):
+            # Nothing to search in, so just show the bone name.
+            self._bone_entry(layout, scene)
+            return
+
         layout.prop_search(
             scene,
             "addon_copy_global_transform_mirror_bone",
             armature_ob.data,
-            "edit_bones" if armature_ob.mode == 'EDIT' else "bones",
+            bones_prop,
             text="Bone",
         )
 
@@ -1043,10 +1211,9 @@ _msgbus_owner = object()
 
 
 def _refresh_3d_panels():
-    refresh_area_types = {'VIEW_3D'}
     for win in bpy.context.window_manager.windows:
         for area in win.screen.areas:
-            if area.type not in refresh_area_types:
+            if area.type != 'VIEW_3D':
                 continue
             area.tag_redraw()
 
@@ -1071,6 +1238,9 @@ def _draw_grapheditor_channels_menu(self: bpy.types.GRAPH_MT_channel, context: C
 
 
 def _register_message_bus() -> None:
+    # Clear any existing subscription first, to avoid duplicate notifications
+    # when this is called multiple times without unregistering in between.
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
     bpy.msgbus.subscribe_rna(
         key=(bpy.types.ToolSettings, "use_keyframe_insert_auto"),
         owner=_msgbus_owner,
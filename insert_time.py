@@ -17,6 +17,9 @@
 # ======================= END GPL LICENSE BLOCK ========================
 
 import bpy
+import numpy as np
+
+
 bl_info = {
     'name': 'Insert Time',
     'author': 'Sybren A. Stüvel',
@@ -33,12 +36,29 @@ def insert_time(context: bpy.types.Context, frame_count: int):
 
     playhead = context.scene.frame_current
     for fcurve in context.selected_editable_fcurves:
-        for kp in reversed(fcurve.keyframe_points):
-            if kp.co.x < playhead:
-                break
-            kp.co.x += frame_count
-            kp.handle_left.x += frame_count
-            kp.handle_right.x += frame_count
+        keyframe_points = fcurve.keyframe_points
+        num_coords = 2 * len(keyframe_points)
+
+        # Bulk-read the key & handle coordinates, instead of accessing them key by key.
+        co: np.ndarray = np.empty(num_coords, dtype=np.float32)
+        handle_left: np.ndarray = np.empty(num_coords, dtype=np.float32)
+        handle_right: np.ndarray = np.empty(num_coords, dtype=np.float32)
+        keyframe_points.foreach_get('co', co)
+        keyframe_points.foreach_get('handle_left', handle_left)
+        keyframe_points.foreach_get('handle_right', handle_right)
+
+        to_move = co[0::2] >= playhead
+        if not to_move.any():
+            continue
+
+        # coords[0::2] is a view, so modifying it in-place also updates coords.
+        for coords in (co, handle_left, handle_right):
+            coords_x = coords[0::2]
+            coords_x[to_move] += frame_count
+
+        keyframe_points.foreach_set('co', co)
+        keyframe_points.foreach_set('handle_left', handle_left)
+        keyframe_points.foreach_set('handle_right', handle_right)
         fcurve.update()
 
 